@@ -0,0 +1,21 @@
+from typing import Any, Union
+
+# orjson is optional (pip install PyCharacterAI[fast]),
+# stdlib json is used when it is not installed.
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        return json.loads(data)
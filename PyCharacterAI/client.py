@@ -79,7 +79,10 @@ class AsyncClient(BaseClient):
         self.set_account_id(str((await self.account.fetch_me()).account_id))
 
     async def close_session(self) -> None:
-        await self.__requester.ws_close_async()
+        try:
+            await self.__requester.ws_close_async()
+        finally:
+            await self.__requester.close_async()
 
 
 async def get_client(token: str, **kwargs) -> AsyncClient:
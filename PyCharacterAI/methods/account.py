@@ -1,154 +1,283 @@
+import asyncio
+import time
 import uuid
-import json
-from typing import List, Dict, Union
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import List, Dict, Optional, Tuple, Set, AsyncIterator, Type
 
 from ..types import Account, Persona, CharacterShort, Voice
 from ..exceptions import (
-    FetchError, EditError, UpdateError, CreateError,
+    PyCAIError, FetchError, EditError, UpdateError, CreateError,
     SetError, InvalidArgumentError, DeleteError
 )
 
+from .._json import dumps as _json_dumps, loads as _json_loads
 from ..requester import Requester
 
 
+_URL_USER = "https://plus.character.ai/chat/user/"
+_URL_SETTINGS = "https://plus.character.ai/chat/user/settings/"
+_URL_FOLLOWERS = "https://plus.character.ai/chat/user/followers/"
+_URL_FOLLOWING = "https://plus.character.ai/chat/user/following/"
+_URL_PERSONAS = "https://plus.character.ai/chat/personas/?force_refresh=1"
+_URL_CHARACTERS = "https://plus.character.ai/chat/characters/?scope=user"
+_URL_UPVOTED = "https://plus.character.ai/chat/user/characters/upvoted/"
+_URL_VOICES = "https://neo.character.ai/multimodal/api/v1/voices/user"
+_URL_UPDATE_SETTINGS = "https://plus.character.ai/chat/user/update_settings/"
+_URL_UPDATE_USER = "https://plus.character.ai/chat/user/update/"
+_URL_CREATE_CHARACTER = "https://plus.character.ai/chat/character/create/"
+_URL_PERSONA_UPDATE = "https://plus.character.ai/chat/persona/update/"
+
+# seconds a fetched persona is reused by fetch_my_persona,
+# and how many personas are kept (least recently used are dropped first)
+_PERSONA_CACHE_TTL = 30
+_PERSONA_CACHE_SIZE = 32
+
+
+class _SettingsBatch:
+    def __init__(self, owner: "AccountMethods", token: str, settings: Dict):
+        self.owner = owner
+        self.token = token
+        # set to None on exit, late calls from tasks started inside the block aren't batched
+        self.settings: Optional[Dict] = settings
+
+
+# batch opened by settings_batch() in the current task. tasks started
+# inside the block inherit it, other tasks never see it
+_settings_batch: "ContextVar[Optional[_SettingsBatch]]" = ContextVar("_settings_batch", default=None)
+
+# constant parts of persona payloads, never mutate these
+_CREATE_PERSONA_SKELETON = {
+    "avatar_file_name": "",
+    "base_img_prompt": "",
+    "categories": [],
+    "copyable": False,
+    "description": "This is my persona.",
+    "greeting": "Hello! This is my persona",
+    "img_gen_enabled": False,
+    "strip_img_prompt_from_msg": False,
+    "visibility": "PRIVATE",
+    "voice_id": ""
+}
+
+_PERSONA_UPDATE_SKELETON = {
+    "copyable": False,
+    "default_voice_id": "",
+    "description": "This is my persona.",
+    "greeting": "Hello! This is my persona",
+    "img_gen_enabled": False,
+    "is_persona": True,
+    "participant__num_interactions": 0,
+    "visibility": "PRIVATE"
+}
+
+
 class AccountMethods:
     def __init__(self, client, requester: Requester):
         self.__client = client
         self.__requester = requester
 
-    async def fetch_me(self, **kwargs) -> Account:
-        request = await self.__requester.request_async(
-            url='https://plus.character.ai/chat/user/',
-            options={"headers": self.__client.get_headers(kwargs.get("token", None))}
-        )
+        # keyed by (token, persona_id), so set_token() can't serve another account's persona
+        self.__persona_cache: "OrderedDict[Tuple[str, str], Tuple[float, Persona]]" = OrderedDict()
 
-        if request.status_code == 200:
-            return Account(request.json().get('user').get('user'))
-        
-        raise FetchError('Cannot fetch your account.')
+        # tokens with an open settings_batch() in any task. claimed before the settings
+        # are fetched, so two batches can't overwrite each other's changes
+        self.__batch_tokens: Set[str] = set()
 
-    async def fetch_my_settings(self, **kwargs) -> Dict:
-        request = await self.__requester.request_async(
-            url="https://plus.character.ai/chat/user/settings/",
-            options={"headers": self.__client.get_headers(kwargs.get("token", None))}
-        )
+        # raw body of the last fetched settings, revalidated with If-None-Match.
+        # decoding it again on 304 is cheaper than deep-copying a cached dict
+        self.__settings_body: Optional[bytes] = None
+        self.__settings_etag: Optional[str] = None
+        self.__settings_token: Optional[str] = None
 
-        if request.status_code == 200:
-            return request.json()
+    # token the request is actually made with
+    def __resolve_token(self, token: Optional[str]) -> str:
+        return token or self.__client.get_token()
 
-        raise FetchError('Cannot fetch your settings.')
+    # request helpers, headers are built once per public call and passed explicitly
+    def __get_headers(self, **kwargs) -> Dict:
+        return self.__client.get_headers(kwargs.get("token"))
 
-    async def fetch_my_followers(self, **kwargs) -> List:
-        request = await self.__requester.request_async(
-            url='https://plus.character.ai/chat/user/followers/',
-            options={"headers": self.__client.get_headers(kwargs.get("token", None))}
-        )
+    async def __get_json(self, url: str, headers: Dict, err_cls: Type[PyCAIError], msg: str) -> Dict:
+        request = await self.__requester.request_fast_async(url, "GET", headers)
 
         if request.status_code == 200:
-            return request.json().get("followers", [])
+            return _json_loads(request.content)
 
-        raise FetchError('Cannot fetch your followers.')
+        raise err_cls(msg)
 
-    async def fetch_my_following(self, **kwargs) -> List:
-        request = await self.__requester.request_async(
-            url='https://plus.character.ai/chat/user/following/',
-            options={"headers": self.__client.get_headers(kwargs.get("token", None))}
+    async def __get_json_list(self, url: str, key: str, headers: Dict, err_cls: Type[PyCAIError], msg: str) -> List:
+        response = await self.__get_json(url, headers, err_cls, msg)
+        return response.get(key, [])
+
+    async def __post_json(self, url: str, payload: Optional[Dict], headers: Dict,
+                          err_cls: Type[PyCAIError], msg: str) -> Dict:
+        request = await self.__requester.request_fast_async(
+            url, "POST", headers, _json_dumps(payload) if payload is not None else None
         )
 
         if request.status_code == 200:
-            return request.json().get("following", [])
+            return _json_loads(request.content)
 
-        raise FetchError('Cannot fetch your following.')
+        raise err_cls(msg)
 
-    async def fetch_my_persona(self, persona_id: str, **kwargs) -> Persona:
-        request = await self.__requester.request_async(
-            url=f"https://plus.character.ai/chat/persona/?id={persona_id}",
-            options={"headers": self.__client.get_headers(kwargs.get("token", None))}
-        )
+    # persona cache helpers, entries are keyed by the token they were fetched with
+    def __get_cached_persona(self, persona_id: str, token: Optional[str]) -> Optional[Persona]:
+        key = (self.__resolve_token(token), persona_id)
 
-        if request.status_code == 200:
-            persona = request.json().get("persona", None)
-            if persona:
-                return Persona(persona)
+        cached = self.__persona_cache.get(key)
+        if not cached:
+            return None
 
-        raise FetchError('Cannot fetch your persona. Maybe persona does not exist?')
+        if time.monotonic() - cached[0] >= _PERSONA_CACHE_TTL:
+            self.__persona_cache.pop(key, None)
+            return None
 
-    async def fetch_my_personas(self, **kwargs) -> List[Persona]:
-        request = await self.__requester.request_async(
-            url="https://plus.character.ai/chat/personas/?force_refresh=1",
-            options={"headers": self.__client.get_headers(kwargs.get("token", None))}
-        )
+        self.__persona_cache.move_to_end(key)
+        return cached[1]
 
-        if request.status_code == 200:
-            raw_personas = request.json().get("personas", [])
-            personas = []
+    def __cache_persona(self, persona_id: str, persona: Persona, token: Optional[str]) -> None:
+        key = (self.__resolve_token(token), persona_id)
 
-            for raw_persona in raw_personas:
-                personas.append(Persona(raw_persona))
+        self.__persona_cache[key] = (time.monotonic(), persona)
+        self.__persona_cache.move_to_end(key)
 
-            return personas
+        if len(self.__persona_cache) > _PERSONA_CACHE_SIZE:
+            self.__persona_cache.popitem(last=False)
 
-        raise FetchError('Cannot fetch your personas.')
+    def __uncache_persona(self, persona_id: str, token: Optional[str]) -> None:
+        self.__persona_cache.pop((self.__resolve_token(token), persona_id), None)
 
-    async def fetch_my_characters(self, **kwargs) -> List[CharacterShort]:
-        request = await self.__requester.request_async(
-            url="https://plus.character.ai/chat/characters/?scope=user",
-            options={"headers": self.__client.get_headers(kwargs.get("token", None))}
+    async def fetch_me(self, **kwargs) -> Account:
+        response = await self.__get_json(
+            _URL_USER, self.__get_headers(**kwargs), FetchError, 'Cannot fetch your account.'
         )
+        return Account(response.get('user').get('user'))
+
+    async def fetch_my_settings(self, **kwargs) -> Dict:
+        return await self.__fetch_settings(self.__get_headers(**kwargs), kwargs.get("token"))
+
+    async def __fetch_settings(self, headers: Dict, token: Optional[str], store: bool = True) -> Dict:
+        # the cached body is only valid for the account it was fetched with
+        token = self.__resolve_token(token)
+        use_cache = token == self.__settings_token
+
+        if use_cache and self.__settings_etag is not None:
+            headers = {**headers, "If-None-Match": self.__settings_etag}
+
+        request = await self.__requester.request_fast_async(_URL_SETTINGS, "GET", headers)
+
+        if request.status_code == 304 and use_cache and self.__settings_body is not None:
+            return _json_loads(self.__settings_body)
 
         if request.status_code == 200:
-            raw_characters = request.json().get("characters", [])
-            characters = []
+            # nothing is stored for the read step of a read-modify-write,
+            # the save right after it would throw it away anyway
+            if store:
+                etag = request.headers.get("etag") if request.headers else None
+                self.__settings_body = request.content if etag else None
+                self.__settings_etag = etag
+                self.__settings_token = token if etag else None
 
-            for raw_character in raw_characters:
-                characters.append(CharacterShort(raw_character))
+            return _json_loads(request.content)
 
-            return characters
+        raise FetchError('Cannot fetch your settings.')
 
-        raise FetchError('Cannot fetch your characters.')
+    async def fetch_my_followers(self, **kwargs) -> List:
+        return await self.__get_json_list(
+            _URL_FOLLOWERS, "followers", self.__get_headers(**kwargs), FetchError, 'Cannot fetch your followers.'
+        )
 
-    async def fetch_my_upvoted_characters(self, **kwargs) -> List[CharacterShort]:
-        request = await self.__requester.request_async(
-            url=f'https://plus.character.ai/chat/user/characters/upvoted/',
-            options={"headers": self.__client.get_headers(kwargs.get("token", None))}
+    async def fetch_my_following(self, **kwargs) -> List:
+        return await self.__get_json_list(
+            _URL_FOLLOWING, "following", self.__get_headers(**kwargs), FetchError, 'Cannot fetch your following.'
         )
 
-        if request.status_code == 200:
-            characters_raw = request.json().get('characters', [])
-            characters = []
+    async def fetch_my_persona(self, persona_id: str, **kwargs) -> Persona:
+        return await self.__fetch_persona(persona_id, self.__get_headers(**kwargs), kwargs.get("token"))
 
-            for character_raw in characters_raw:
-                characters.append(CharacterShort(character_raw))
-            return characters
+    async def __fetch_persona(self, persona_id: str, headers: Dict, token: Optional[str]) -> Persona:
+        cached = self.__get_cached_persona(persona_id, token)
+        if cached is not None:
+            return cached
 
-        raise FetchError('Cannot fetch your upvoted characters.')
+        error = 'Cannot fetch your persona. Maybe persona does not exist?'
 
-    async def fetch_my_voices(self, **kwargs) -> List[Voice]:
-        request = await self.__requester.request_async(
-            url=f"https://neo.character.ai/multimodal/api/v1/voices/user",
-            options={"headers": self.__client.get_headers(kwargs.get("token", None))}
+        response = await self.__get_json(
+            f"https://plus.character.ai/chat/persona/?id={persona_id}", headers, FetchError, error
         )
 
-        if request.status_code == 200:
-            raw_voices = request.json().get("voices", [])
-            voices = []
+        raw_persona = response.get("persona")
+        if not raw_persona:
+            raise FetchError(error)
+
+        persona = Persona(raw_persona)
+        self.__cache_persona(persona_id, persona, token)
+        return persona
+
+    async def fetch_my_personas(self, **kwargs) -> List[Persona]:
+        raw_personas = await self.__get_json_list(
+            _URL_PERSONAS, "personas", self.__get_headers(**kwargs), FetchError, 'Cannot fetch your personas.'
+        )
+        return [Persona(raw_persona) for raw_persona in raw_personas]
+
+    async def fetch_my_characters(self, **kwargs) -> List[CharacterShort]:
+        raw_characters = await self.__get_json_list(
+            _URL_CHARACTERS, "characters", self.__get_headers(**kwargs), FetchError, 'Cannot fetch your characters.'
+        )
+        return [CharacterShort(raw_character) for raw_character in raw_characters]
 
-            for raw_voice in raw_voices:
-                voices.append(Voice(raw_voice))
+    async def fetch_my_upvoted_characters(self, **kwargs) -> List[CharacterShort]:
+        raw_characters = await self.__get_json_list(
+            _URL_UPVOTED, 'characters', self.__get_headers(**kwargs),
+            FetchError, 'Cannot fetch your upvoted characters.'
+        )
+        return [CharacterShort(raw_character) for raw_character in raw_characters]
+
+    async def fetch_my_voices(self, **kwargs) -> List[Voice]:
+        response = await self.__get_json(
+            _URL_VOICES, self.__get_headers(**kwargs), FetchError, 'Cannot fetch your voices.'
+        )
+        return [Voice(raw_voice) for raw_voice in response.get("voices", [])]
+
+    async def fetch_my_dashboard(
+        self, **kwargs
+    ) -> Tuple[List, List, List[Persona], List[CharacterShort], List[Voice]]:
+        # these requests don't depend on each other, so they are sent concurrently
+        followers, following, personas, characters, voices = await asyncio.gather(
+            self.fetch_my_followers(**kwargs),
+            self.fetch_my_following(**kwargs),
+            self.fetch_my_personas(**kwargs),
+            self.fetch_my_characters(**kwargs),
+            self.fetch_my_voices(**kwargs)
+        )
 
-            return voices
-        raise FetchError('Cannot fetch your voices.')
+        return followers, following, personas, characters, voices
 
     async def __update_settings(self, options: Dict, **kwargs) -> Dict:
-        default_persona_id = options.get("default_persona_id", None)
-        persona_override = options.get("persona_override", None)
-        voice_override = options.get("voice_override", None)
-        character_id = options.get("character_id", None)
+        default_persona_id = options.get("default_persona_id")
+        persona_override = options.get("persona_override")
+        voice_override = options.get("voice_override")
+        character_id = options.get("character_id")
 
         if default_persona_id is None and persona_override is None and voice_override is None:
             raise UpdateError('Cannot update account settings.')
 
-        settings = await self.fetch_my_settings(**kwargs)
+        # calls for another client or account than the batch's one are not batched
+        batch = _settings_batch.get()
+        in_batch = (
+            batch is not None
+            and batch.owner is self
+            and batch.settings is not None
+            and batch.token == self.__resolve_token(kwargs.get("token"))
+        )
+
+        if in_batch:
+            settings = batch.settings
+        else:
+            headers = self.__get_headers(**kwargs)
+            settings = await self.__fetch_settings(headers, kwargs.get("token"), store=False)
 
         if default_persona_id is not None:
             settings["default_persona_id"] = default_persona_id
@@ -159,29 +288,59 @@ class AccountMethods:
 
             settings["personaOverrides"] = persona_overrides
 
-        request = await self.__requester.request_async(
-            url="https://plus.character.ai/chat/user/update_settings/",
-            options={
-                "method": 'POST',
-                "headers": self.__client.get_headers(kwargs.get("token", None)),
-                "body": json.dumps(settings)
-            }
-        )
+        if in_batch:
+            # will be saved on exit from settings_batch()
+            return settings
 
-        if request.status_code == 200:
-            response = request.json()
+        return await self.__save_settings(settings, headers)
+
+    async def __save_settings(self, settings: Dict, headers: Dict) -> Dict:
+        # the server will have a new version, so the cached one can't be revalidated
+        self.__settings_body = None
+        self.__settings_etag = None
+        self.__settings_token = None
 
-            if response.get("success", False):
-                return response.get("settings")
+        response = await self.__post_json(
+            _URL_UPDATE_SETTINGS, settings, headers, UpdateError, 'Cannot update account settings.'
+        )
+
+        if response.get("success", False):
+            return response.get("settings")
 
         raise UpdateError('Cannot update account settings.')
 
+    @asynccontextmanager
+    async def settings_batch(self, **kwargs) -> AsyncIterator[Dict]:
+        token = self.__resolve_token(kwargs.get("token"))
+
+        current = _settings_batch.get()
+        if token in self.__batch_tokens or (current is not None and current.owner is self
+                                            and current.settings is not None):
+            raise UpdateError('Cannot update account settings. Batch is already in progress.')
+
+        self.__batch_tokens.add(token)
+        try:
+            headers = self.__get_headers(**kwargs)
+            batch = _SettingsBatch(self, token, await self.__fetch_settings(headers, token, store=False))
+
+            context_token = _settings_batch.set(batch)
+            try:
+                yield batch.settings
+                settings = batch.settings
+            finally:
+                batch.settings = None
+                _settings_batch.reset(context_token)
+        finally:
+            self.__batch_tokens.discard(token)
+
+        await self.__save_settings(settings, headers)
+
     async def edit_account(self, name: str, username: str, bio: str = "", avatar_rel_path: str = "", **kwargs) -> bool:
-        if len(username) < 2 or len(name) > 20:
+        if not 2 <= len(username) <= 20:
             raise InvalidArgumentError(f"Cannot edit account info. "
                                        f"Username must be at least 2 characters and no more than 20.")
 
-        if len(name) < 2 or len(name) > 50:
+        if not 2 <= len(name) <= 50:
             raise InvalidArgumentError(f"Cannot edit account info. "
                                        f"Name must be at least 2 characters and no more than 50.")
 
@@ -199,26 +358,18 @@ class AccountMethods:
         if avatar_rel_path:
             new_account_info["avatar_rel_path"] = avatar_rel_path
 
-        request = await self.__requester.request_async(
-            url='https://plus.character.ai/chat/user/update/',
-            options={
-                "method": 'POST',
-                "headers": self.__client.get_headers(kwargs.get("token", None)),
-                "body": json.dumps(new_account_info)
-            }
+        response = await self.__post_json(
+            _URL_UPDATE_USER, new_account_info, self.__get_headers(**kwargs), EditError, 'Cannot edit account info.'
         )
 
-        if request.status_code == 200:
-            status = request.json().get("status", "")
-
-            if status == "OK":
-                return True
+        status = response.get("status", "")
+        if status == "OK":
+            return True
 
-            raise EditError(f"Cannot edit account info. {status}")
-        raise EditError('Cannot edit account info.')
+        raise EditError(f"Cannot edit account info. {status}")
 
     async def create_persona(self, name: str, definition: str = "", avatar_rel_path: str = "", **kwargs) -> Persona:
-        if len(name) < 3 or len(name) > 20:
+        if not 3 <= len(name) <= 20:
             raise InvalidArgumentError(f"Cannot create persona. "
                                        f"Name must be at least 3 characters and no more than 20.")
 
@@ -226,42 +377,27 @@ class AccountMethods:
             raise InvalidArgumentError(f"Cannot create persona. "
                                        f"Definition must be no more than 728 characters.")
 
-        request = await self.__requester.request_async(
-            url=f"https://plus.character.ai/chat/character/create/",
-            options={
-                "method": 'POST',
-                "headers": self.__client.get_headers(kwargs.get("token", None)),
-                "body": json.dumps({
-                    "avatar_file_name": "",
-                    "avatar_rel_path": avatar_rel_path,
-                    "base_img_prompt": "",
-                    "categories": [],
-                    "copyable": False,
-                    "definition": definition,
-                    "description": "This is my persona.",
-                    "greeting": "Hello! This is my persona",
-                    "identifier": f"id:{str(uuid.uuid4())}",
-                    "img_gen_enabled": False,
-                    "name": name,
-                    "strip_img_prompt_from_msg": False,
-                    "title": name,
-                    "visibility": "PRIVATE",
-                    "voice_id": ""
-                })
-            }
+        payload = {
+            **_CREATE_PERSONA_SKELETON,
+            "avatar_rel_path": avatar_rel_path,
+            "definition": definition,
+            "identifier": f"id:{uuid.uuid4()}",
+            "name": name,
+            "title": name
+        }
+
+        response = await self.__post_json(
+            _URL_CREATE_CHARACTER, payload, self.__get_headers(**kwargs), CreateError, "Cannot create persona."
         )
 
-        if request.status_code == 200:
-            response = request.json()
-            if response.get("status", None) == "OK" and response.get("persona", None) is not None:
-                return Persona(response.get("persona"))
+        if response.get("status") == "OK" and response.get("persona"):
+            return Persona(response.get("persona"))
 
-            raise CreateError(f"Cannot create persona. {response.get('error', '')}")
-        raise CreateError(f"Cannot create persona.")
+        raise CreateError(f"Cannot create persona. {response.get('error', '')}")
 
     async def edit_persona(self, persona_id: str, name: str = "", definition: str = "",
-                           avatar_rel_path: str = "", **kwargs) -> Persona:
-        if name and (len(name) < 3 or len(name) > 20):
+                           avatar_rel_path: str = "", persona: Optional[Persona] = None, **kwargs) -> Persona:
+        if name and not 3 <= len(name) <= 20:
             raise InvalidArgumentError(f"Cannot edit persona. "
                                        f"Name must be at least 3 characters and no more than 20.")
 
@@ -269,140 +405,113 @@ class AccountMethods:
             raise InvalidArgumentError(f"Cannot edit persona. "
                                        f"Definition must be no more than 728 characters.")
 
-        try:
-            old_persona = await self.fetch_my_persona(persona_id, **kwargs)
-        except Exception:
-            raise EditError("Cannot edit persona. May be persona does not exist?")
+        headers = self.__get_headers(**kwargs)
+
+        old_persona = persona
+        if old_persona is None:
+            try:
+                old_persona = await self.__fetch_persona(persona_id, headers, kwargs.get("token"))
+            except PyCAIError:
+                raise EditError("Cannot edit persona. May be persona does not exist?")
+
+        avatar_name = avatar_rel_path or (old_persona.avatar.get_file_name() if old_persona.avatar else "")
 
         payload = {
-                    "avatar_file_name": old_persona.avatar.get_file_name() if old_persona.avatar else "",
-                    "avatar_rel_path": old_persona.avatar.get_file_name() if old_persona.avatar else "",
-                    "copyable": False,
-                    "default_voice_id": "",
-                    "definition": definition or old_persona.definition,
-                    "description": "This is my persona.",
-                    "enabled": False,
-                    "external_id": persona_id,
-                    "greeting": "Hello! This is my persona",
-                    "img_gen_enabled": False,
-                    "is_persona": True,
-                    "name": name or old_persona.name,
-                    "participant__name": name or old_persona.name,
-                    "participant__num_interactions": 0,
-                    "title": name,
-                    "user__id": self.__client.get_account_id(),
-                    "user__username": old_persona.author_username,
-                    "visibility": "PRIVATE"
+            **_PERSONA_UPDATE_SKELETON,
+            "avatar_file_name": avatar_name,
+            "avatar_rel_path": avatar_name,
+            "definition": definition or old_persona.definition,
+            "enabled": False,
+            "external_id": persona_id,
+            "name": name or old_persona.name,
+            "participant__name": name or old_persona.name,
+            "title": name,
+            "user__id": self.__client.get_account_id(),
+            "user__username": old_persona.author_username
         }
 
-        if avatar_rel_path:
-            payload["avatar_file_name"] = avatar_rel_path
-            payload["avatar_rel_path"] = avatar_rel_path
-
-        request = await self.__requester.request_async(
-            url=f"https://plus.character.ai/chat/persona/update/",
-            options={
-                "method": 'POST',
-                "headers": self.__client.get_headers(kwargs.get("token", None)),
-                "body": json.dumps(payload)
-            }
+        response = await self.__post_json(
+            _URL_PERSONA_UPDATE, payload, headers, EditError, "Cannot edit persona."
         )
 
-        if request.status_code == 200:
-            response = request.json()
-            if response.get("status", None) == "OK" and response.get("persona", None) is not None:
-                return Persona(response.get("persona"))
+        if response.get("status") == "OK" and response.get("persona"):
+            new_persona = Persona(response.get("persona"))
+            self.__cache_persona(persona_id, new_persona, kwargs.get("token"))
+            return new_persona
 
-            raise EditError(f"Cannot edit persona. {response.get('error', '')}")
-        raise EditError(f"Cannot edit persona.")
+        raise EditError(f"Cannot edit persona. {response.get('error', '')}")
 
-    async def delete_persona(self, persona_id: str, **kwargs) -> bool:
-        try:
-            old_persona = await self.fetch_my_persona(persona_id, **kwargs)
-        except Exception:
-            raise DeleteError("Cannot delete persona. May be persona does not exist?")
+    async def delete_persona(self, persona_id: str, persona: Optional[Persona] = None, **kwargs) -> bool:
+        headers = self.__get_headers(**kwargs)
+
+        old_persona = persona
+        if old_persona is None:
+            try:
+                old_persona = await self.__fetch_persona(persona_id, headers, kwargs.get("token"))
+            except PyCAIError:
+                raise DeleteError("Cannot delete persona. May be persona does not exist?")
+
+        avatar_name = old_persona.avatar.get_file_name() if old_persona.avatar else ""
 
         payload = {
+            **_PERSONA_UPDATE_SKELETON,
             "archived": True,
-            "avatar_file_name": old_persona.avatar.get_file_name() if old_persona.avatar else "",
-            "copyable": False,
-            "default_voice_id": "",
+            "avatar_file_name": avatar_name,
             "definition": old_persona.definition,
-            "description": "This is my persona.",
             "external_id": persona_id,
-            "greeting": "Hello! This is my persona",
-            "img_gen_enabled": False,
-            "is_persona": True,
             "name": old_persona.name,
             "participant__name": old_persona.name,
-            "participant__num_interactions": 0,
             "title": old_persona.name,
             "user__id": self.__client.get_account_id(),
-            "user__username": old_persona.author_username,
-            "visibility": "PRIVATE"
+            "user__username": old_persona.author_username
         }
 
-        request = await self.__requester.request_async(
-            url=f"https://plus.character.ai/chat/persona/update/",
-            options={
-                "method": 'POST',
-                "headers": self.__client.get_headers(kwargs.get("token", None)),
-                "body": json.dumps(payload)
-            }
+        response = await self.__post_json(
+            _URL_PERSONA_UPDATE, payload, headers, DeleteError, "Cannot delete persona."
         )
 
-        if request.status_code == 200:
-            response = request.json()
-            if response.get("status", None) == "OK" and response.get("persona", None) is not None:
-                return True
+        if response.get("status") == "OK" and response.get("persona"):
+            self.__uncache_persona(persona_id, kwargs.get("token"))
+            return True
 
-            raise DeleteError(f"Cannot delete persona. {response.get('error', '')}")
-        raise DeleteError(f"Cannot delete persona.")
+        raise DeleteError(f"Cannot delete persona. {response.get('error', '')}")
 
-    async def set_default_persona(self, persona_id: Union[str, None], **kwargs) -> bool:
+    async def set_default_persona(self, persona_id: Optional[str], **kwargs) -> bool:
         try:
-            if persona_id is None:
-                persona_id = ""
-
-            await self.__update_settings({"default_persona_id": persona_id}, **kwargs)
+            await self.__update_settings({"default_persona_id": persona_id or ""}, **kwargs)
             return True
-        except Exception:
+        except PyCAIError:
             raise SetError(f"Cannot set default persona.")
 
     async def unset_default_persona(self, **kwargs) -> bool:
         return await self.set_default_persona(None, **kwargs)
 
-    async def set_persona(self, character_id: str, persona_id: Union[str, None], **kwargs) -> bool:
+    async def set_persona(self, character_id: str, persona_id: Optional[str], **kwargs) -> bool:
         try:
-            if persona_id is None:
-                persona_id = ""
-
             await self.__update_settings({
-                    "persona_override": persona_id,
+                    "persona_override": persona_id or "",
                     "character_id": character_id
             }, **kwargs)
             return True
-        except Exception:
+        except PyCAIError:
             raise SetError(f"Cannot set persona.")
     
     async def unset_persona(self, character_id: str, **kwargs) -> bool:
         return await self.set_persona(character_id, None, **kwargs)
 
-    async def set_voice(self, character_id: str, voice_id: Union[str, None], **kwargs) -> bool:
-        method = "update" if voice_id else "delete"
+    async def set_voice(self, character_id: str, voice_id: Optional[str], **kwargs) -> bool:
+        if voice_id:
+            method, payload = "update", {"voice_id": voice_id}
+        else:
+            method, payload = "delete", None
 
-        request = await self.__requester.request_async(
-            url=f"https://plus.character.ai/chat/character/{character_id}/voice_override/{method}/",
-            options={
-                "method": 'POST',
-                "headers": self.__client.get_headers(kwargs.get("token", None)),
-                "body": json.dumps({"voice_id": voice_id}) if voice_id else None
-            }
+        response = await self.__post_json(
+            f"https://plus.character.ai/chat/character/{character_id}/voice_override/{method}/",
+            payload, self.__get_headers(**kwargs), SetError, "Cannot set voice."
         )
 
-        if request.status_code == 200:
-            if (request.json()).get("success", False):
-                return True
+        if response.get("success", False):
+            return True
 
         raise SetError(f"Cannot set voice.")
 
@@ -1,7 +1,8 @@
 import asyncio
 import json
+import warnings
 
-from typing import Dict, AsyncGenerator, List, Optional, cast
+from typing import Dict, AsyncGenerator, List, Optional, Union, cast
 
 # for requests
 from curl_cffi import requests as curl_cffi_requests
@@ -23,9 +24,20 @@ class Requester:
 
         self.__proxy: Optional[str] = self.__extra_options.pop("proxy", None)
 
+        # passed with every request instead of living in the session's cookie jar
+        self.__cookies = self.__extra_options.pop("cookies", None)
+
         # debug information (TO-DO)
         self.__debug: bool = self.__extra_options.pop("requester_debug", False)
 
+        # one session is reused for all requests, so connections to
+        # plus.character.ai / neo.character.ai are kept alive between them.
+        # its cookie jar is cleared before every request, so cookies set by
+        # a response are not sent with later requests (e.g. with another token)
+        self.__session: Optional[curl_cffi_requests.AsyncSession] = None
+        self.__session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__stale_sessions: List[curl_cffi_requests.AsyncSession] = []
+
         self.__ws_session: Optional[aiohttp.ClientSession] = None
         self.__ws: Optional[aiohttp.ClientWebSocketResponse] = None
         self.__ws_response_messages: Dict[str, List] = {}
@@ -52,36 +64,89 @@ class Requester:
         def json(self):
             return json.loads(self.text)
 
+    async def __get_session(self) -> curl_cffi_requests.AsyncSession:
+        loop = asyncio.get_running_loop()
+
+        # curl-cffi sessions are bound to the event loop they were created in.
+        # a session left from another loop can't be used or closed here, so its
+        # curl multi handle (and any open sockets) leak. it is kept until
+        # close_async() reports it, then its easy handles are freed with it
+        if self.__session is not None and self.__session_loop is not loop:
+            self.__stale_sessions.append(self.__session)
+            self.__session = None
+
+        if self.__session is None:
+            self.__session = curl_cffi_requests.AsyncSession(
+                impersonate=self.__impersonate or "chrome",
+                proxy=self.__proxy,
+                **self.__extra_options,
+            )
+            self.__session_loop = loop
+
+        return self.__session
+
+    async def close_async(self) -> None:
+        if self.__session is not None and self.__session_loop is not asyncio.get_running_loop():
+            self.__stale_sessions.append(self.__session)
+            self.__session = None
+            self.__session_loop = None
+
+        if self.__stale_sessions:
+            warnings.warn(
+                f"{len(self.__stale_sessions)} HTTP session(s) created in another event loop "
+                f"could not be closed. Use one event loop per client to avoid this.",
+                ResourceWarning,
+            )
+            self.__stale_sessions = []
+
+        if self.__session:
+            try:
+                await self.__session.close()
+            finally:
+                self.__session = None
+                self.__session_loop = None
+
     async def request_async(self, url: str, options=None) -> Response:
         if options is None:
             options = {}
 
-        method = options.get("method", "GET")
-        headers = options.get("headers", {})
-        body = options.get("body", {})
+        return await self.request_fast_async(
+            url,
+            method=options.get("method", "GET"),
+            headers=options.get("headers", {}),
+            body=options.get("body", {}),
+        )
 
+    # same as request_async(), but without building and unpacking an options dict
+    async def request_fast_async(
+        self,
+        url: str,
+        method: str = "GET",
+        headers: Optional[Dict] = None,
+        body: Optional[Union[bytes, str, Dict]] = None,
+    ) -> Response:
         raw_response: Optional[curl_cffi_requests.Response] = None
 
+        session = await self.__get_session()
+        session.cookies.clear()
+
+        cookies = self.__cookies
+
         try:
-            async with curl_cffi_requests.AsyncSession(
-                impersonate=self.__impersonate or "chrome",
-                proxy=self.__proxy,
-                **self.__extra_options,
-            ) as session:
-                if method == "GET":
-                    raw_response = await session.get(url, headers=headers)
+            if method == "GET":
+                raw_response = await session.get(url, headers=headers, cookies=cookies)
 
-                elif method == "POST":
-                    raw_response = await session.post(url, headers=headers, data=body)
+            elif method == "POST":
+                raw_response = await session.post(url, headers=headers, data=body, cookies=cookies)
 
-                elif method == "PUT":
-                    raw_response = await session.put(url, headers=headers, data=body)
+            elif method == "PUT":
+                raw_response = await session.put(url, headers=headers, data=body, cookies=cookies)
 
-                elif method == "PATCH":
-                    raw_response = await session.patch(url, headers=headers, data=body)
+            elif method == "PATCH":
+                raw_response = await session.patch(url, headers=headers, data=body, cookies=cookies)
 
-                elif method == "DELETE":
-                    raw_response = await session.delete(url, headers=headers)
+            elif method == "DELETE":
+                raw_response = await session.delete(url, headers=headers, cookies=cookies)
 
         except curl_cffi_requests.errors.RequestsError:
             raise RequestError
@@ -17,6 +17,7 @@ setup(
     url="https://github.com/Xtr4F/PyCharacterAI",
     packages=find_packages(),
     install_requires=["curl-cffi==0.7.1", "aiohttp"],
+    extras_require={"fast": ["orjson>=3.10"]},
     classifiers=[
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",